@@ -1,17 +1,50 @@
+import os
+import re
 import time
+import queue
 import random
+import asyncio
+import aiohttp
+import ijson
+import orjson
 import pickle
+import msgspec
 import loguru
 import datetime
 import requests
 import threading
-import pandas as pd
 
-from seleniumwire import webdriver
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selenium import webdriver
 from selenium.common import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+# Web-node id is the host prefix of any online.sberbank.ru URL; compiled
+# once so node extraction is a single C-level scan.
+NODE_RE = re.compile(r"^https://([^.]+)\.online\.sberbank\.ru")
 
 
 class SberBankOperationsFilter:
+    # Filters are created per page/query in paginated scrapes; __slots__
+    # keeps them __dict__-free for cheap construction and attribute access.
+    __slots__ = (
+        "type",
+        "date_from",
+        "date_to",
+        "resource",
+        "_result_format",
+        "pagination_offset",
+        "pagination_size",
+        "show_hidden",
+        "stream",
+        "_payload_template",
+        "_materialize"
+    )
+
     def __init__(
         self,
         operation_type: str = None,
@@ -21,115 +54,396 @@ class SberBankOperationsFilter:
         result_format: any = None,
         pagination_offset: int = 0,
         pagination_size: int = 51,
-        show_hidden=False
+        show_hidden=False,
+        stream: bool = False
     ):
         self.type = operation_type
         self.date_from = date_from
         self.date_to = date_to
         self.resource = resource
-        self.result_format = result_format if result_format == dict or result_format == pd.DataFrame else None
+        self.result_format = result_format
         self.pagination_offset = pagination_offset
         self.pagination_size = pagination_size
         self.show_hidden = show_hidden if isinstance(show_hidden, bool) else False
-        self.logger = loguru.logger
+        # With stream=True the requests path yields operations one at a time
+        # instead of materializing the full page list.
+        self.stream = stream if isinstance(stream, bool) else False
+        # Payload fields that never change between pages, computed once so
+        # paginated fetches don't rebuild the whole dict per request.
+        self._payload_template = {
+            key: value for key, value in (
+                ("filterName", self.type),
+                ("from", self.date_from),
+                ("to", self.date_to),
+                ("usedResource", self.resource),
+                ("paginationSize", self.pagination_size),
+                ("showHidden", self.show_hidden)
+            ) if value is not None
+        }
+    @property
+    def result_format(self):
+        return self._result_format
 
-        if result_format and not self.result_format:
-            self.logger.warning(f"SberBankOperationsFilter doesn't support result format: {result_format}. "
-                                f"result_format is set to None")
+    @result_format.setter
+    def result_format(self, result_format):
+        """
+        Validates the format and rebinds the result materializer with it, so
+        the fetch paths make a single indirect call instead of re-branching
+        per page — and so assigning result_format after construction (the
+        usage pattern in the tests/ scripts) takes effect.
+        """
+        # pandas costs ~250 ms and ~60 MB to import; only pull it in when a
+        # caller actually asks for a non-default result format.
+        if result_format is not None:
+            import pandas as pd
+            if result_format not in (dict, pd.DataFrame):
+                loguru.logger.warning(f"SberBankOperationsFilter doesn't support result format: {result_format}. "
+                                      f"result_format is set to None")
+                result_format = None
+        self._result_format = result_format
+        # Anything other than None/dict is pd.DataFrame at this point.
+        if result_format is not None and result_format is not dict:
+            self._materialize = SberBankApiClient._to_dataframe
+        else:
+            self._materialize = lambda operations: operations
+
+    def payload_for_offset(self, pagination_offset: int) -> dict:
+        """
+        Returns the request payload for a given page offset, reusing the
+        cached template. A fresh dict is returned so concurrent page workers
+        can't clobber each other's offset.
+        """
+        return {**self._payload_template, "paginationOffset": pagination_offset}
+
+    def next_page(self):
+        """
+        Advances the filter to the next pagination window, so callers can
+        loop over pages without constructing new filter objects.
+        """
+        self.pagination_offset += self.pagination_size
+        return self
 
     def to_json(self):
-        payload = {
-            "filterName": self.type,
-            "from": self.date_from,
-            "to": self.date_to,
-            "usedResource": self.resource,
-            "paginationOffset": self.pagination_offset,
-            "paginationSize": self.pagination_size,
-            "showHidden": self.show_hidden
-        }
-        # Remove keys with None values
-        return {key: value for key, value in payload.items() if value is not None}
+        # The static portion is cached in __init__; only the offset varies.
+        return self.payload_for_offset(self.pagination_offset)
+
+
+class SberDriverPool:
+    """
+    Module-wide pool of Chrome drivers. Spawning Chrome + chromedriver
+    costs seconds of wall time and hundreds of MB of RSS, so released
+    drivers are kept warm and handed to the next client instead of being
+    re-spawned. Instances are recycled after MAX_USES_PER_INSTANCE
+    check-outs to keep long-lived Chrome processes from bloating.
+    """
+    POOL_SIZE = 2
+    MAX_USES_PER_INSTANCE = 50
+
+    _idle = queue.Queue(maxsize=POOL_SIZE)
+    _uses = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, headless: bool = False):
+        driver = None
+        skipped = []
+        # Only hand out idle drivers running in the requested mode.
+        while driver is None:
+            try:
+                candidate = cls._idle.get_nowait()
+            except queue.Empty:
+                break
+            if getattr(candidate, "_rubank_headless", False) == headless:
+                driver = candidate
+            else:
+                skipped.append(candidate)
+        for candidate in skipped:
+            try:
+                cls._idle.put_nowait(candidate)
+            except queue.Full:
+                candidate.quit()
+        if driver is None:
+            driver = cls._new_driver(headless)
+        with cls._lock:
+            cls._uses[id(driver)] = cls._uses.get(id(driver), 0) + 1
+        return driver
+
+    @classmethod
+    def release(cls, driver):
+        with cls._lock:
+            worn_out = cls._uses.get(id(driver), 0) >= cls.MAX_USES_PER_INSTANCE
+        try:
+            if not worn_out:
+                driver.delete_all_cookies()
+                cls._idle.put_nowait(driver)
+                return
+        except Exception:
+            # Queue full or the driver is already unusable; fall through
+            # and quit it below.
+            pass
+        with cls._lock:
+            cls._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @classmethod
+    def _new_driver(cls, headless: bool = False):
+        options = webdriver.ChromeOptions()
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if headless:
+            # Headless skips compositor/render work; disabling images cuts
+            # bandwidth and decode time on every refresh of the keep-alive
+            # loop.
+            options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        driver = webdriver.Chrome(options=options)
+        driver._rubank_headless = headless
+        # Cap the CDP network buffers so captured request/response data
+        # can't grow unboundedly between performance-log drains.
+        driver.execute_cdp_cmd("Network.enable", {
+            "maxTotalBufferSize": 10_000_000,
+            "maxResourceBufferSize": 5_000_000
+        })
+        return driver
 
 
 class SberBankApiClient:
     LOGIN_URL = "https://online.sberbank.ru/CSAFront/index.do"
 
-    def __init__(self, path_to_cookies_file: str = None):
-        self.path_to_cookies_file = path_to_cookies_file if path_to_cookies_file else "sber_cookies.pkl"
+    # A warmup that succeeded this recently is trusted without a new call.
+    WARMUP_TTL_SECONDS = 60
+
+    # Fields of an operation as returned by /uoh-bh/v1/operations/list.
+    # Declaring them up-front lets pandas skip column discovery and per-cell
+    # dtype probing when building DataFrames from operation records.
+    _OPERATION_COLUMNS = (
+        "id",
+        "uohId",
+        "date",
+        "form",
+        "state",
+        "type",
+        "description",
+        "correspondent",
+        "operationAmount",
+        "nationalAmount"
+    )
+    # Stable scalar columns get explicit dtypes so pandas materializes
+    # typed columns directly instead of leaving boxed object arrays.
+    _OPERATION_DTYPES = {
+        "id": "string",
+        "uohId": "string",
+        "form": "category",
+        "state": "category",
+        "type": "category",
+        "description": "string"
+    }
+
+    def __init__(self, path_to_cookies_file: str = None, headless: bool = False, http2: bool = False):
+        self.path_to_cookies_file = path_to_cookies_file if path_to_cookies_file else "sber_cookies.json"
+        # Headless drivers are much cheaper to keep alive, but the manual
+        # login flow needs a visible window, so headed stays the default.
+        self.headless = headless if isinstance(headless, bool) else False
+        # With http2=True the operations POSTs go through a multiplexed
+        # httpx client: one TLS handshake shared by all concurrent pages.
+        self.http2 = http2 if isinstance(http2, bool) else False
+        self._http2_client = None
         self.session = requests.Session()
+        # Pool connections to the sberbank web nodes so repeated get_operations /
+        # warmUp calls reuse the same TCP+TLS connection instead of re-handshaking.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"])
+            )
+        )
+        self.session.mount("https://", adapter)
         self.request_cookies = None
         self.selenium_driver_cookies = None
         self.headers = None
         self.logger = loguru.logger
-        self.driver = webdriver.Chrome()
-
-        # User logs in manually.
-        self._login_and_save_session()
-        self.logger.info("New session is created. You're in!")
+        self._aio_session = None
+        self._last_warmup_ts = 0.0
+        # Single-writer queue for conserved-session snapshots: maxsize=1 with
+        # drop-old coalescing, so the keep-alive loop never blocks on file I/O.
+        self._persist_q = queue.Queue(maxsize=1)
+        threading.Thread(target=self._persist_worker, daemon=True).start()
+        # The Chrome driver costs seconds of wall time and hundreds of MB of
+        # RAM, so it is only created when a manual login is actually needed.
+        self.driver = None
+        # Browser request headers captured from Network.requestWillBeSent,
+        # keyed by CDP requestId until the matching response is drained.
+        self._request_headers_by_id = {}
+
+        if self._load_session():
+            self.logger.info("Cached session restored. You're in!")
+        else:
+            # User logs in manually.
+            self._login_and_save_session()
+            self.logger.info("New session is created. You're in!")
+        # Freeze the session-wide headers once so every subsequent call
+        # skips per-request header merging.
+        if self.headers:
+            # gzip only: advertising br would invite brotli responses the
+            # installed decoders can't inflate.
+            self.headers.setdefault("Accept-Encoding", "gzip")
+            self.headers["Connection"] = "keep-alive"
+            self.session.headers.update(self.headers)
         self.session_started = datetime.datetime.now()
 
-        # Start two daemon threads:
-        # 1. To simulate random human-like activity.
-        # 2. To watch for warmUp session requests and conserve session data.
-        self._start_activity_threads()
+        if self.driver is not None:
+            # Start two daemon threads:
+            # 1. To simulate random human-like activity.
+            # 2. To watch for warmUp session requests and conserve session data.
+            self._start_activity_threads()
 
-    def _start_activity_threads(self):
-        human_activity_thread = threading.Thread(target=self._simulate_human_activity, daemon=True)
-        warmup_watch_thread = threading.Thread(target=self._watch_warmup_requests, daemon=True)
-        human_activity_thread.start()
-        warmup_watch_thread.start()
+    def _build_driver(self):
+        """
+        Checks a Chrome driver out of the shared pool. The drivers come with
+        the performance log enabled, so network requests can be observed
+        through CDP events instead of selenium-wire's in-process MITM proxy
+        (which re-encrypts and buffers every browser request in Python).
+        """
+        return SberDriverPool.acquire(headless=self.headless)
 
-    def _simulate_human_activity(self):
+    def close(self):
         """
-        Periodically performs random actions (e.g. scrolling) to simulate human activity.
+        Returns the driver (if any) to the shared pool. The keep-alive
+        threads stop on the next iteration; the client can keep serving
+        driverless requests through the conserved session afterwards.
         """
-        self.driver.get(self.OPERATIONS_PAGE_URL)
-        while True:
+        if self.driver is not None:
+            driver, self.driver = self.driver, None
+            SberDriverPool.release(driver)
+
+    def _wait_for_network_request(self, url_part: str, timeout: float):
+        """
+        Polls the performance log until a completed response's URL contains
+        url_part. Returns (url, request_headers) of the match or raises
+        TimeoutException. CDP replacement for selenium-wire's
+        wait_for_request; the headers come from the browser's outgoing
+        request, never from the response.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for url, request_headers in self._drain_network_requests():
+                if url_part in url:
+                    return url, request_headers
+            time.sleep(0.5)
+        raise TimeoutException(f"No request matching '{url_part}' was seen within {timeout} seconds")
+
+    def _drain_network_requests(self):
+        """
+        Drains the performance log once and returns [(url, request_headers)]
+        for every completed response since the last drain. get_log is
+        destructive, so all log consumers must share a single drain path —
+        two concurrent pollers would swallow each other's events.
+
+        Headers are captured from Network.requestWillBeSent and held by
+        requestId; Network.responseReceived only contributes the final URL
+        (redirects surface it nowhere else). Response headers are never
+        returned — they would otherwise be replayed on outbound requests.
+        """
+        matches = []
+        for entry in self.driver.get_log("performance"):
             try:
-                # Example: Scroll by a random amount.
-                scroll_amount = random.randint(50, 200)
-                self.driver.execute_script("window.scrollBy(0, arguments[0]);", scroll_amount)
-                time.sleep(random.uniform(1, 3))
-                self.driver.refresh()
-
-                request = self.driver.wait_for_request(self.OPERATIONS_URL, timeout=10)
-                self.logger.info(f"_simulate_human_activity invoked get operations request: {request}")
-                self.headers = request.headers
-                self.logger.info(f"get operations request headers: {request.headers}")
-                self.SBERBANK_BACKEND_API_WEB_NODE_HEADERS = request.headers
-                self.__conserve_session()
-
-                self.logger.info(f"Simulated human activity: scrolled by {scroll_amount} pixels.")
-            except Exception as e:
-                self.logger.error(f"Error simulating human activity: {e}")
+                message = orjson.loads(entry["message"])["message"]
+            except (KeyError, orjson.JSONDecodeError):
+                continue
+            params = message.get("params", {})
+            method = message.get("method")
+            if method == "Network.requestWillBeSent":
+                headers = params.get("request", {}).get("headers", {})
+                self._request_headers_by_id[params.get("requestId")] = headers
+            elif method == "Network.responseReceived":
+                request_id = params.get("requestId")
+                url = params.get("response", {}).get("url", "")
+                if url:
+                    matches.append((url, self._request_headers_by_id.pop(request_id, {})))
+        # Requests that never completed (cancelled, buffer wrap) would
+        # otherwise pin their headers here forever.
+        if len(self._request_headers_by_id) > 500:
+            self._request_headers_by_id.clear()
+        return matches
+
+    def _start_activity_threads(self):
+        # One daemon thread runs an asyncio loop hosting both keep-alive
+        # jobs. They are 99% wall-clock sleep, so a single thread with
+        # asyncio.sleep pacing replaces the two dedicated threads.
+        keepalive_thread = threading.Thread(target=self._run_keepalive_loop, daemon=True)
+        keepalive_thread.start()
+
+    async def _keepalive_loop(self):
+        await asyncio.gather(self._human_activity_task(), self._network_watch_task())
+
+    def _run_keepalive_loop(self):
+        asyncio.run(self._keepalive_loop())
+
+    async def _human_activity_task(self):
+        """
+        Periodically performs random actions (e.g. scrolling) to simulate
+        human activity. The requests those actions trigger are picked up by
+        _network_watch_task, which owns the performance log.
+        """
+        await asyncio.to_thread(self.driver.get, self.OPERATIONS_PAGE_URL)
+        while self.driver is not None:
+            await asyncio.to_thread(self._human_activity_step)
             # Wait a random period before next action.
-            time.sleep(random.uniform(30, 60))
+            await asyncio.sleep(random.uniform(30, 60))
+
+    def _human_activity_step(self):
+        try:
+            # Example: Scroll by a random amount.
+            scroll_amount = random.randint(50, 200)
+            self.driver.execute_script("window.scrollBy(0, arguments[0]);", scroll_amount)
+            time.sleep(random.uniform(1, 3))
+            self.driver.refresh()
+            self.logger.info(f"Simulated human activity: scrolled by {scroll_amount} pixels.")
+        except Exception as e:
+            self.logger.error(f"Error simulating human activity: {e}")
 
-    def _watch_warmup_requests(self):
+    async def _network_watch_task(self):
         """
-        Waits for warmUp session requests using Selenium Wire's wait_for_request.
-        When such a request is detected, session data is conserved.
+        Single consumer of the performance log while the keep-alive loop
+        runs: drains it once per tick and dispatches warmup and operations
+        matches to their handlers.
         """
-        while True:
+        last_warmup_seen = time.monotonic()
+        while self.driver is not None:
             try:
-                self.logger.info("Waiting for warmUp session request...")
-                # Wait for a warmUp request. Adjust the timeout as needed.
-                request = self.driver.wait_for_request(self.WARMUP_URL, timeout=800)
-                if request:
-                    self.logger.info("WarmUp session request detected.")
-                    # Clear the request log to prevent memory buildup.
-                    self.driver.requests.clear()
-                    time.sleep(random.uniform(10, 40))
-            except TimeoutException:
-                self.logger.warning(f"Timeout occurred while waiting for warmUp request! "
-                                    f"Session was kept alive for {datetime.datetime.now() - self.session_started}...")
-
-                # TODO: Check if session is dead
-
-                # TODO: Pause. Send alert to user via telegram with new QR code for re-creating session
-                #  (if session is dead, otherwise do nothing)
+                for url, request_headers in await asyncio.to_thread(self._drain_network_requests):
+                    if self.OPERATIONS_URL in url:
+                        self._handle_operations_request(url, request_headers)
+                    elif self.WARMUP_URL in url:
+                        last_warmup_seen = time.monotonic()
+                        self.logger.info("WarmUp session request detected.")
+                if time.monotonic() - last_warmup_seen > 800:
+                    self.logger.warning(f"No warmUp request observed for 800 seconds! "
+                                        f"Session was kept alive for {datetime.datetime.now() - self.session_started}...")
+                    last_warmup_seen = time.monotonic()
+
+                    # TODO: Check if session is dead
+
+                    # TODO: Pause. Send alert to user via telegram with new QR code for re-creating session
+                    #  (if session is dead, otherwise do nothing)
             except Exception as e:
-                self.logger.error(f"Error in warmUp watch thread: {e}")
+                self.logger.error(f"Error in network watch task: {e}")
+            await asyncio.sleep(1)
+
+    def _handle_operations_request(self, url: str, request_headers: dict):
+        self.logger.info(f"get operations request detected: {url}")
+        self.headers = request_headers
+        self.SBERBANK_BACKEND_API_WEB_NODE_HEADERS = request_headers
+        self.__conserve_session()
 
     def __initialize_sberbank_public_api_endpoints(
             self,
@@ -147,9 +461,85 @@ class SberBankApiClient:
         self.LOG_REPORT_URL = f"https://{self.SBERBANK_FRONTEND_WEB_NODE_ID}.online.sberbank.ru/api/log/report"
         self.OPERATIONS_URL = f"https://{self.SBERBANK_BACKEND_API_WEB_NODE_ID}.online.sberbank.ru/uoh-bh/v1/operations/list"
 
+    def _load_session(self):
+        """
+        Tries to restore a previously conserved session without opening a
+        browser. Returns True when the cached cookies still pass the
+        warmUpSession check, False otherwise.
+        """
+        session_data = self._load_session_data()
+        if not session_data:
+            return False
+        try:
+            self.request_cookies = session_data["cookies"]
+            self.selenium_driver_cookies = session_data.get("selenium_driver_cookies")
+            self.headers = session_data["headers"]
+            self.__initialize_sberbank_public_api_endpoints(
+                session_data["sberbank_frontend_web_node_id"],
+                session_data["sberbank_backend_api_web_node_id"]
+            )
+        except KeyError as e:
+            self.logger.warning(f"Conserved session data is missing key {e}. Falling back to manual login...")
+            return False
+        self._last_warmup_ts = session_data.get("last_warmup_ts", 0.0)
+        self.session.cookies.update(self.request_cookies)
+        if self._validate_session():
+            return True
+        self.logger.info("Conserved session is no longer valid...")
+        return False
+
+    def _validate_session(self):
+        """
+        Checks that the restored cookies are still accepted by sberbank by
+        firing the same warmUpSession request the web app itself uses.
+        A warmup fresher than WARMUP_TTL_SECONDS is trusted without a new
+        round trip.
+        """
+        if time.time() - self._last_warmup_ts < self.WARMUP_TTL_SECONDS:
+            return True
+        try:
+            # A HEAD to /main settles the clearly-valid (200) and
+            # clearly-expired (redirect to login / 401) cases with a
+            # zero-byte body; only ambiguous statuses pay for the full
+            # warmup POST and its JSON parse.
+            head = self.session.head(self.MAIN_URL, allow_redirects=False, timeout=5)
+            if head.status_code == 200:
+                return True
+            if head.status_code in (301, 302, 401):
+                return False
+        except requests.RequestException:
+            pass
+        try:
+            response = self.session.post(self.WARMUP_URL, timeout=10)
+        except requests.RequestException as e:
+            self.logger.error(f"Error validating conserved session: {e}")
+            return False
+        if response.status_code != 200:
+            return False
+        try:
+            if self._json(response).get("code") == 0:
+                self._last_warmup_ts = time.time()
+                return True
+            return False
+        except orjson.JSONDecodeError:
+            return False
+
+    def warm_up_session(self):
+        """
+        Keeps a driverless session alive by firing the warmUpSession request
+        on demand. No-op while the last successful warmup is still fresh.
+        """
+        return self._validate_session()
+
     def _login_and_save_session(self):
         try:
             self.logger.info("No valid session found. Initiating login process...")
+            self.driver = self._build_driver()
+            session_data = self._load_session_data()
+            if session_data:
+                # Even when the cached cookies failed validation, restoring
+                # them often lets the web app skip part of the login flow.
+                self.__restore_browser_session(session_data)
             self.driver.get(self.LOGIN_URL)
             self.logger.info("Waiting for the user to log in manually...")
 
@@ -178,17 +568,54 @@ class SberBankApiClient:
         self.__conserve_session()
         self.logger.info("Session data saved. You're in!")
 
+    def __restore_browser_session(self, session_data: dict):
+        """
+        Loads previously conserved cookies and localStorage into the freshly
+        created driver. add_cookie only works for the domain currently open,
+        so the driver navigates to each cookie's domain before setting it.
+        """
+        # Group cookies by domain so each domain is navigated to exactly
+        # once; driver.get is already synchronous, so no settle sleep is
+        # needed between add_cookie calls.
+        cookies_by_domain = defaultdict(list)
+        for cookie in session_data.get("selenium_driver_cookies") or []:
+            domain = cookie.get("domain", "").lstrip(".")
+            if domain:
+                cookies_by_domain[domain].append(cookie)
+        for domain, domain_cookies in cookies_by_domain.items():
+            self.driver.get(f"https://{domain}")
+            for cookie in domain_cookies:
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception as e:
+                    self.logger.warning(f"Couldn't restore cookie {cookie.get('name')}: {e}")
+
+        local_storage = session_data.get("local_storage") or {}
+        if local_storage:
+            self.__load_local_storage(local_storage)
+
+    def __load_local_storage(self, local_storage: dict):
+        # Ship the whole dict in one execute_script round-trip instead of
+        # paying a driver round-trip per key.
+        self.driver.execute_script(
+            "const data = JSON.parse(arguments[0]); for (const key in data) localStorage.setItem(key, data[key]);",
+            orjson.dumps(local_storage).decode()
+        )
+
     def __get_sber_frontend_web_node_id(self):
-        self.logger.info("Waiting for request to determine SBERBANK_FRONTEND_WEB_NODE_ID...")
-        request = self.driver.wait_for_request('/main', timeout=100)  # Adjust timeout as needed.
-        return request.url.split(".")[:1:][0].split("https://")[1]
+        self.logger.info("Waiting for the browser to land on /main to determine SBERBANK_FRONTEND_WEB_NODE_ID...")
+        # WebDriverWait exits as soon as the URL matches instead of the old
+        # one-second polling loop, so login-complete latency is minimal.
+        WebDriverWait(self.driver, timeout=300, poll_frequency=0.2).until(
+            EC.url_matches(r"https://[^.]+\.online\.sberbank\.ru/main")
+        )
+        return NODE_RE.match(self.driver.current_url).group(1)
 
     def __get_sber_backend_api_web_node_id(self):
         self.logger.info("Waiting for request to determine SBERBANK_BACKEND_API_WEB_NODE_ID...")
-        request = self.driver.wait_for_request('/main-screen/rest/v2/m1/web/section/meta', timeout=20)
-        self.SBERBANK_BACKEND_API_WEB_NODE_HEADERS = request.headers
-        endpoint_parts = request.url.split(".")
-        return endpoint_parts[:1:][0].split("https://")[1]
+        url, request_headers = self._wait_for_network_request('/main-screen/rest/v2/m1/web/section/meta', timeout=20)
+        self.SBERBANK_BACKEND_API_WEB_NODE_HEADERS = request_headers
+        return NODE_RE.match(url).group(1)
 
     def __conserve_session(self):
         """
@@ -200,9 +627,18 @@ class SberBankApiClient:
         self.session.cookies.update(self.request_cookies)
 
         self.headers = {
-            "User-Agent": self.driver.execute_script("return navigator.userAgent;")
+            "User-Agent": self.__evaluate_in_browser("navigator.userAgent")
         }
         self.headers.update(self.SBERBANK_BACKEND_API_WEB_NODE_HEADERS)
+        # The captured browser headers may lack/override these: make sure
+        # responses stay compressed (operations JSON shrinks 6-10x) and the
+        # pooled connections stay open between calls. gzip only — the
+        # dependency set ships no brotli decoder.
+        self.headers.setdefault("Accept-Encoding", "gzip")
+        self.headers["Connection"] = "keep-alive"
+        # Freeze the refreshed headers into the session so request paths
+        # don't merge per-call header/cookie dicts.
+        self.session.headers.update(self.headers)
 
         session_data = {
             "cookies": self.request_cookies,
@@ -210,47 +646,266 @@ class SberBankApiClient:
             "headers": self.headers,
             "local_storage": self.get_local_storage(),
             "sberbank_frontend_web_node_id": self.SBERBANK_FRONTEND_WEB_NODE_ID,
-            "sberbank_backend_api_web_node_id": self.SBERBANK_BACKEND_API_WEB_NODE_ID
+            "sberbank_backend_api_web_node_id": self.SBERBANK_BACKEND_API_WEB_NODE_ID,
+            "last_warmup_ts": self._last_warmup_ts
         }
-        with open(self.path_to_cookies_file, "wb") as f:
-            pickle.dump(session_data, f)
-        self.logger.info("Session conserved to file.")
+        try:
+            self._persist_q.put_nowait(session_data)
+        except queue.Full:
+            # Coalesce: drop the stale snapshot, keep the newest one.
+            try:
+                self._persist_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._persist_q.put_nowait(session_data)
+            except queue.Full:
+                pass
+
+    def _persist_worker(self):
+        """
+        Dedicated writer thread for conserved-session snapshots. Writes to a
+        temp file and os.replace's it into place, so a crash mid-write never
+        leaves a half-written cache.
+        """
+        while True:
+            session_data = self._persist_q.get()
+            try:
+                tmp_path = self.path_to_cookies_file + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(orjson.dumps(session_data))
+                os.replace(tmp_path, self.path_to_cookies_file)
+                self.logger.info("Session conserved to file.")
+            except Exception as e:
+                self.logger.error(f"Error persisting session data: {e}")
+
+    def _load_session_data(self):
+        """
+        Reads the conserved session data back from disk. The cache is plain
+        JSON (orjson); msgpack and pickle decodes remain as one-shot
+        migration fallbacks for caches written by older versions. Returns
+        None when there is no usable cache file.
+        """
+        if not os.path.exists(self.path_to_cookies_file):
+            return None
+        try:
+            with open(self.path_to_cookies_file, "rb") as f:
+                raw = f.read()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+            try:
+                return msgspec.msgpack.decode(raw, type=dict)
+            except msgspec.DecodeError:
+                # Legacy pickle cache (pre-msgpack). Migration path only.
+                return pickle.loads(raw)
+        except Exception as e:
+            self.logger.error(f"Error loading conserved session data: {e}")
+            return None
+
+    def __evaluate_in_browser(self, expression: str):
+        """
+        Evaluates a JS expression through a single CDP Runtime.evaluate
+        round-trip, skipping Selenium's heavier execute_script command
+        dispatch and marshalling.
+        """
+        return self.driver.execute_cdp_cmd(
+            "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+        )["result"]["value"]
 
     def get_local_storage(self):
-        return self.driver.execute_script("""
-            var ls = {};
-            for (var i = 0; i < localStorage.length; i++) {
-                var key = localStorage.key(i);
-                ls[key] = localStorage.getItem(key);
-            }
-            return ls;
-        """)
+        # Serialize in the browser, decode once with orjson: one CDP call
+        # and one C-speed JSON parse for the whole store.
+        raw = self.__evaluate_in_browser(
+            "JSON.stringify(Object.fromEntries(Object.entries(localStorage)))"
+        )
+        return orjson.loads(raw)
+
+    @staticmethod
+    def _json(response) -> dict:
+        """
+        Decodes a response body with orjson, which is several times faster
+        than the stdlib json used by response.json() on large operation pages.
+        """
+        return orjson.loads(response.content)
+
+    @classmethod
+    def _to_dataframe(cls, operations: list[dict]) -> "pd.DataFrame":
+        """
+        Builds a typed DataFrame from operation records: fixed column order
+        via from_records plus explicit dtypes for the stable scalar columns,
+        skipping pandas' per-cell inference pass. Nested dict columns
+        (amounts, correspondent) are kept as-is; use pd.json_normalize on
+        the records if flattened columns are needed.
+        """
+        import pandas as pd
+        df = pd.DataFrame.from_records(operations, columns=cls._OPERATION_COLUMNS)
+        return df.astype(cls._OPERATION_DTYPES, copy=False)
 
     @staticmethod
     def __parse_operations_json_response(data: dict) -> list[dict]:
         return data['body']['operations']
 
     def get_operations_via_requests(self, _filter: SberBankOperationsFilter):
-        payload = _filter.to_json()
-        response = self.session.post(
-            self.OPERATIONS_URL, json=payload, headers=self.headers, cookies=self.request_cookies
-        )
+        if _filter.stream:
+            # Hand back the streaming generator: rows are parsed as the
+            # caller consumes them, with no intermediate page list.
+            return self.get_operations_stream(_filter)
+        # Session-wide headers and cookies are already frozen on the
+        # underlying client; only the offset varies per call.
+        response = self._post_operations(_filter.payload_for_offset(_filter.pagination_offset))
         if response.status_code == 200:
-            data = response.json()
-            if _filter.result_format == pd.DataFrame:
-                return pd.DataFrame(self.__parse_operations_json_response(data))
-            else:
-                return self.__parse_operations_json_response(data)
+            data = self._json(response)
+            return _filter._materialize(self.__parse_operations_json_response(data))
         else:
             self.logger.info("Failed to get operations. Status code:", response.status_code)
         return None
 
+    def _post_operations(self, payload: dict):
+        """
+        POSTs an orjson-encoded payload to the operations endpoint. When
+        http2 is enabled, a lazily created httpx.Client(http2=True) is used
+        so concurrent page fetches multiplex over a single TLS connection;
+        otherwise the pooled requests session handles it. Both response
+        types expose status_code and content, which is all the callers read.
+        """
+        body = orjson.dumps(payload)
+        headers = {"Content-Type": "application/json"}
+        if self.http2:
+            if self._http2_client is None:
+                import httpx
+                self._http2_client = httpx.Client(
+                    http2=True,
+                    headers=dict(self.session.headers),
+                    cookies=self.request_cookies,
+                    timeout=30
+                )
+            return self._http2_client.post(self.OPERATIONS_URL, content=body, headers=headers)
+        return self.session.post(self.OPERATIONS_URL, data=body, headers=headers)
+
+    def _one_page(self, _filter: SberBankOperationsFilter, pagination_offset: int) -> list[dict]:
+        """
+        Fetches a single operations page at the given offset over the pooled
+        session. Returns the raw list of operation dicts.
+        """
+        response = self._post_operations(_filter.payload_for_offset(pagination_offset))
+        if response.status_code != 200:
+            self.logger.info(f"Failed to get operations page at offset {pagination_offset}. "
+                             f"Status code: {response.status_code}")
+            return []
+        return self.__parse_operations_json_response(self._json(response))
+
+    def iter_operations(self, _filter: SberBankOperationsFilter, workers: int = 4):
+        """
+        Generator that yields operation pages (lists of dicts) until the
+        filter's date window is exhausted. The first page is fetched serially
+        to learn the total count; the remaining offsets are fetched
+        concurrently over the pooled session, so N pages cost roughly
+        N / workers round trips instead of N.
+        """
+        response = self._post_operations(_filter.payload_for_offset(_filter.pagination_offset))
+        if response.status_code != 200:
+            self.logger.info(f"Failed to get operations. Status code: {response.status_code}")
+            return
+        data = self._json(response)
+        yield self.__parse_operations_json_response(data)
+
+        total = data.get("body", {}).get("totalCount")
+        first_offset = _filter.pagination_offset
+        if total is None:
+            # The server didn't report a total; fall back to serial paging
+            # until a short page signals the end.
+            offset = first_offset + _filter.pagination_size
+            while True:
+                page = self._one_page(_filter, offset)
+                if not page:
+                    return
+                yield page
+                if len(page) < _filter.pagination_size:
+                    return
+                offset += _filter.pagination_size
+        else:
+            offsets = range(first_offset + _filter.pagination_size, total, _filter.pagination_size)
+            # Keep workers <= pool_maxsize of the mounted adapter so every
+            # in-flight request still gets a pooled connection.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(lambda offset: self._one_page(_filter, offset), offsets)
+
+    async def _ensure_aio_session(self) -> aiohttp.ClientSession:
+        # aiohttp sessions are bound to the running event loop, so the
+        # session is created lazily inside a coroutine.
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(cookies=self.request_cookies, headers=self.headers)
+        return self._aio_session
+
+    async def get_operations_async(self, _filter: SberBankOperationsFilter):
+        """
+        Async variant of get_operations_via_requests. Awaiting several of
+        these concurrently overlaps the network round trips, so N fetches
+        cost roughly one RTT instead of N.
+        """
+        session = await self._ensure_aio_session()
+        payload = _filter.payload_for_offset(_filter.pagination_offset)
+        async with session.post(self.OPERATIONS_URL, json=payload) as response:
+            if response.status != 200:
+                self.logger.info(f"Failed to get operations. Status code: {response.status}")
+                return None
+            # Read raw bytes and decode with orjson instead of aiohttp's
+            # stdlib-json response.json().
+            data = orjson.loads(await response.read())
+        return _filter._materialize(self.__parse_operations_json_response(data))
+
+    def get_operations_batch(self, filters: list):
+        """
+        Fetches the operations for every filter concurrently and returns the
+        results in the same order. Sync wrapper around get_operations_async
+        for callers that don't run their own event loop.
+        """
+        async def _run():
+            try:
+                return await asyncio.gather(*(self.get_operations_async(f) for f in filters))
+            finally:
+                # The session can't outlive asyncio.run's event loop.
+                if self._aio_session is not None and not self._aio_session.closed:
+                    await self._aio_session.close()
+                self._aio_session = None
+
+        return asyncio.run(_run())
+
+    def get_operations_stream(self, _filter: SberBankOperationsFilter):
+        """
+        Streaming variant of get_operations_via_requests. Parses operations
+        out of the response incrementally with ijson instead of materializing
+        the full JSON tree, so peak memory stays flat for large pagination
+        sizes. Yields one operation dict at a time.
+        """
+        payload = _filter.payload_for_offset(_filter.pagination_offset)
+        response = self.session.post(
+            self.OPERATIONS_URL,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            stream=True
+        )
+        with response:
+            if response.status_code != 200:
+                self.logger.info(f"Failed to get operations. Status code: {response.status_code}")
+                return
+            # Let urllib3 inflate gzip transparently while we stream.
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'body.operations.item')
+
     def get_operations(self, _filter: SberBankOperationsFilter):
         """
         Uses the browser's fetch() API to POST to the operations endpoint.
         This ensures the request is sent using the live browser session,
         thereby avoiding proxy issues that can occur with requests.Session.
         """
+        if self.driver is None:
+            # Warm-start clients run without a browser; use the plain
+            # requests.Session path instead.
+            return self.get_operations_via_requests(_filter)
+
         payload = _filter.to_json()
 
         # The asynchronous script to run in the browser context.
@@ -285,7 +940,4 @@ class SberBankApiClient:
         # Parse the response.
         operations = data.get('body', {}).get('operations', [])
 
-        if _filter.result_format == pd.DataFrame:
-            return pd.DataFrame(operations)
-        else:
-            return operations
+        return _filter._materialize(operations)
@@ -1,15 +1,27 @@
 import os
-import json
+import re
 import time
-import gzip
+import orjson
 import random
 import pickle
 import loguru
 import datetime
 import requests
 import threading
+import numpy as np
 import pandas as pd
-from seleniumwire import webdriver
+
+try:
+    # ISA-L accelerated inflate (~2-3x stdlib zlib) when installed;
+    # drop-in compatible, so the stdlib module is a transparent fallback.
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+import base64
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selenium import webdriver
 from selenium.common import TimeoutException
 
 
@@ -42,8 +54,18 @@ class TBankOperationsFilter:
         if date_str.isdigit():
             return date_str
         try:
-            # Parse the string using the provided format (example: "01.02.2024T00:00:00")
-            dt = datetime.datetime.strptime(date_str, "%d.%m.%YT%H:%M:%S")
+            # The format is fixed ("01.02.2024T00:00:00"), so slice the
+            # fields out directly — an order of magnitude cheaper than
+            # strptime, which recompiles its format spec on every call.
+            try:
+                dt = datetime.datetime(
+                    int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2]),
+                    int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+                )
+            except ValueError:
+                # Malformed or differently-delimited input: let strptime
+                # produce its usual diagnostic.
+                dt = datetime.datetime.strptime(date_str, "%d.%m.%YT%H:%M:%S")
             # Convert to Unix timestamp in milliseconds
             timestamp = int(dt.timestamp() * 1000)
             return str(timestamp)
@@ -68,8 +90,30 @@ class TBankApiClient:
     AUTH_CHECK_URL = "https://www.tbank.ru/api/common/v1/session/check_auth"
 
     SESSION_STATUS_ENDPOINT = "https://www.tbank.ru/api/common/v1/session_status"
+
+    # Fields of an operation as returned by /api/common/v1/operations.
+    # Pre-declared so the DataFrame branch skips column discovery and
+    # per-cell dtype inference over the nested payload dicts.
+    _TBANK_COLUMNS = (
+        "id",
+        "type",
+        "group",
+        "status",
+        "description",
+        "debitingTime",
+        "operationTime",
+        "amount",
+        "accountAmount",
+        "merchant",
+        "category",
+        "mcc"
+    )
     OPERATIONS_ENDPOINT_REGEX = \
         r"^https://www\.tbank\.ru/api/common/v1/operations(?!(_piechart|_histogram|_category_list)).*"
+    # Compiled once at class definition time; the watcher threads match
+    # this against every captured request, so handing re a pre-compiled
+    # pattern avoids repeated cache lookups on the hot path.
+    _OPERATIONS_RE = re.compile(OPERATIONS_ENDPOINT_REGEX)
 
     # self.LOG_REPORT_URL = f"https://www.tbank.ru/api/front/log/collect"
 
@@ -79,24 +123,63 @@ class TBankApiClient:
 
     # self.USER_INFO_URL = "GET https://tmsg.tbank.ru/app/bank/messenger/userInfo"
 
+    # Full snapshot rewrites happen once per this many captured batches;
+    # in between, new operations only hit the append-only oplog.
+    SNAPSHOT_EVERY_BATCHES = 20
+
     def __init__(self, path_to_cookies_file: str = "tbank_cookies.pkl"):
         self.operations_file = '../tbank_operations.json'
+        self.operations_log_file = '../tbank_operations.jsonl'
+        self._batches_since_snapshot = 0
+        # Snapshot mtime as of the last load/write; None means "no snapshot
+        # on disk", -1 means "never loaded" so the first load always runs.
+        self._cache_mtime_ns = -1
 
         self.login_timeout_seconds = 240
         self.operations_page_timeout_seconds = 100
         self.path_to_cookies_file = path_to_cookies_file
         self.session = requests.Session()
+        # Pool connections to tbank.ru so direct API calls reuse the same
+        # TCP+TLS connection instead of re-handshaking per request.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://www.tbank.ru", adapter)
         self.request_cookies = None
         self.selenium_driver_cookies = None
         self.headers = None
         self.logger = loguru.logger
-        self.driver = webdriver.Chrome()
+        # Headers captured from Network.requestWillBeSent, keyed by CDP
+        # requestId until the matching response shows up in the log.
+        self._pending_request_headers = {}
+        # Plain Chrome with the CDP network domain instead of selenium-wire:
+        # no in-process mitmproxy re-terminating TLS and copying every
+        # response body through Python. The performance log feeds
+        # _event_loop, and bodies are pulled over CDP only for the
+        # operations endpoint.
+        options = webdriver.ChromeOptions()
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        self.driver = webdriver.Chrome(options=options)
+        # Cap the CDP network buffers so captured response data can't grow
+        # unboundedly between performance-log drains.
+        self.driver.execute_cdp_cmd("Network.enable", {
+            "maxTotalBufferSize": 10_000_000,
+            "maxResourceBufferSize": 5_000_000
+        })
+
+        # The cache and its index must exist before login: the first
+        # operations response is captured during _login_and_save_session
+        # and merged through __save_new_operations_to_cache_file.
+        self._ops_index = (np.empty(0, dtype=np.int64), [])
+        self.all_operations = self.__load_cached_operations()
+        self._rebuild_ops_index()
 
         # User logs in manually.
         self._login_and_save_session()
         self.logger.info("New session is created. You're in!")
         self.session_started = datetime.datetime.now()
-        self.all_operations = json.loads(self.operations_file)
 
         # Start two daemon threads:
         # 1. To simulate random human-like activity.
@@ -104,11 +187,8 @@ class TBankApiClient:
         self._start_activity_threads()
 
     def _start_activity_threads(self):
-        watch_session_status_thread = threading.Thread(target=self._watch_session_status_requests, daemon=True)
-        watch_session_status_thread.start()
-
-        watch_get_operations_requests_thread = threading.Thread(target=self._watch_get_operations_requests, daemon=True)
-        watch_get_operations_requests_thread.start()
+        event_loop_thread = threading.Thread(target=self._event_loop, daemon=True)
+        event_loop_thread.start()
 
         human_activity_thread = threading.Thread(target=self._simulate_human_activity, daemon=True)
         human_activity_thread.start()
@@ -116,6 +196,7 @@ class TBankApiClient:
     def _simulate_human_activity(self):
         """
         Periodically performs random actions (e.g. scrolling) to simulate human activity.
+        The traffic those actions trigger is picked up by _event_loop.
         """
         self.driver.get(self.OPERATIONS_PAGE_URL)
         while True:
@@ -123,66 +204,100 @@ class TBankApiClient:
                 scroll_amount = random.randint(50, 200)
                 self.driver.execute_script("window.scrollBy(0, arguments[0]);", scroll_amount)
                 time.sleep(random.uniform(1, 3))
-                self.driver.refresh()
-
-                request = self.driver.wait_for_request(self.OPERATIONS_ENDPOINT_REGEX, timeout=10)
-                self.logger.info(f"_simulate_human_activity invoked get operations request: {request}")
-                self.headers = request.headers
-                self.logger.info(f"get operations request headers: {request.headers}")
-                self.__conserve_session()
-
+                # A full refresh re-downloads and re-executes the whole SPA
+                # every cycle; an in-page session_status fetch keeps the
+                # session warm for the cost of one XHR, and _event_loop
+                # still sees it on the wire.
+                self.driver.execute_script(
+                    "window.dispatchEvent(new Event('focus'));"
+                    " fetch('/api/common/v1/session_status', {credentials: 'include'});"
+                )
                 self.logger.info(f"Simulated human activity: scrolled by {scroll_amount} pixels.")
             except Exception as e:
                 self.logger.error(f"Error simulating human activity: {e}")
             # Wait a random period before next action.
             time.sleep(random.uniform(30, 60))
 
-    def _watch_session_status_requests(self):
+    def _event_loop(self):
         """
-        Waits for warmUp session requests using Selenium Wire's wait_for_request.
-        When such a request is detected, session data is conserved.
+        Single consumer of Chrome's performance log. Each tick drains the
+        log once and dispatches completed responses by URL; uninteresting
+        traffic costs one JSON parse per event and response bodies only
+        cross the CDP boundary for the operations endpoint.
         """
         while True:
             try:
-                self.logger.info("Waiting for session status request...")
-                # Wait for a warmUp request. Adjust the timeout as needed.
-                request = self.driver.wait_for_request(self.SESSION_STATUS_ENDPOINT, timeout=800)
-                self.__initialize_tbank_public_api_endpoints(request.params)
-                self.headers = request.headers
-
-                if request:
-                    self.logger.info("Session status request detected.")
-                    # Clear the request log to prevent memory buildup.
-                    self.driver.requests.clear()
-                    time.sleep(random.uniform(10, 40))
-            except TimeoutException:
-                self.logger.warning(f"Timeout occurred while waiting for session status request! "
-                                    f"Session was kept alive for {datetime.datetime.now() - self.session_started}...")
-
-                # TODO: Check if session is dead
-
-                # TODO: Pause. Send alert to user via telegram with new QR code for re-creating session
-                #  (if session is dead, otherwise do nothing)
+                for url, request_headers, request_id in self._drain_network_responses():
+                    if self._OPERATIONS_RE.match(url):
+                        self._handle_ops(request_headers, request_id)
+                    elif url.startswith(self.SESSION_STATUS_ENDPOINT):
+                        self._handle_status(request_headers)
             except Exception as e:
-                self.logger.error(f"Error in session status watch thread: {e}")
+                self.logger.error(f"Error in event loop thread: {e}")
+            time.sleep(1)
 
-    def _watch_get_operations_requests(self):
-        while True:
+    def _drain_network_responses(self):
+        """
+        Yields (url, request_headers, request_id) for every completed
+        response in the performance log since the last drain. Request
+        headers arrive on Network.requestWillBeSent and are held until the
+        matching Network.responseReceived event.
+        """
+        for entry in self.driver.get_log("performance"):
             try:
-                self.logger.info("Waiting for get_operations request...")
-                # Wait for a warmUp request. Adjust the timeout as needed.
-                request = self.driver.wait_for_request(self.OPERATIONS_ENDPOINT_REGEX, timeout=800)
-                self.__initialize_tbank_public_api_endpoints(request.params)
-                self.headers = request.headers
-
-                if request:
-                    self.logger.info("get_operations request detected.")
-                    self.__save_new_operations_to_cache_file(request.response.body)
-                    # Clear the request log to prevent memory buildup.
-                    self.driver.requests.clear()
-                    time.sleep(random.uniform(10, 40))
-            except Exception as e:
-                self.logger.error(f"Error in _watch_get_operations_requests thread: {e}")
+                message = orjson.loads(entry["message"])["message"]
+            except (KeyError, orjson.JSONDecodeError):
+                continue
+            params = message.get("params", {})
+            method = message.get("method")
+            if method == "Network.requestWillBeSent":
+                headers = params.get("request", {}).get("headers", {})
+                self._pending_request_headers[params.get("requestId")] = headers
+            elif method == "Network.responseReceived":
+                request_id = params.get("requestId")
+                url = params.get("response", {}).get("url", "")
+                yield url, self._pending_request_headers.pop(request_id, {}), request_id
+        # Requests that never got a response (cancelled, still in flight
+        # when the buffer wrapped) would otherwise pin their headers here
+        # forever.
+        if len(self._pending_request_headers) > 500:
+            self._pending_request_headers.clear()
+
+    def _fetch_response_body(self, request_id) -> bytes:
+        """
+        Pulls a captured response body over CDP. Chrome hands text bodies
+        back as str and flags binary ones as base64; either way the caller
+        gets bytes, already inflated by the browser.
+        """
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except Exception as e:
+            self.logger.error(f"Could not fetch response body for {request_id}: {e}")
+            return b""
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            return base64.b64decode(body)
+        return body.encode()
+
+    def _handle_ops(self, request_headers, request_id):
+        self.logger.info("get_operations request detected.")
+        self.__initialize_tbank_public_api_endpoints()
+        self.headers = request_headers
+        body = self._fetch_response_body(request_id)
+        if body:
+            self.__save_new_operations_to_cache_file(body)
+        self.__conserve_session()
+
+    def _handle_status(self, request_headers):
+        self.logger.info("Session status request detected.")
+        self.__initialize_tbank_public_api_endpoints()
+        self.headers = request_headers
+        self.__conserve_session()
+
+        # TODO: Check if session is dead
+
+        # TODO: Pause. Send alert to user via telegram with new QR code for re-creating session
+        #  (if session is dead, otherwise do nothing)
 
     def __initialize_tbank_public_api_endpoints(
             self,
@@ -212,76 +327,185 @@ class TBankApiClient:
         #     f"wuid={self.wuid}"
         # )
 
+    def _rebuild_ops_index(self):
+        """
+        Rebuilds the flat index over self.all_operations: a sorted int64
+        array of debitingTime milliseconds with a parallel list of the
+        operations. Date-window queries then reduce to a searchsorted plus
+        one slice instead of a per-operation nested-dict walk and int()
+        parse.
+        """
+        indexed = sorted(
+            (
+                (int(op["debitingTime"]["milliseconds"]), op)
+                for op in self.all_operations.values()
+                if op.get("debitingTime", {}).get("milliseconds") is not None
+            ),
+            key=lambda pair: pair[0]
+        )
+        keys = np.fromiter(
+            (millis for millis, _ in indexed), dtype=np.int64, count=len(indexed)
+        )
+        ops = [op for _, op in indexed]
+        # Published as one tuple: the assignment is atomic under the GIL,
+        # so readers on other threads can never pair a new keys array with
+        # an old ops list.
+        self._ops_index = (keys, ops)
+        # The DataFrame mirror is rebuilt lazily: captured batches arrive
+        # far more often than DataFrame queries, so mark it stale instead
+        # of paying from_records on every cache update.
+        self._ops_df_dirty = True
+
+    def _get_ops_df(self) -> pd.DataFrame:
+        """
+        Returns the DataFrame mirror of the operations index, rebuilding it
+        only when the index changed since the last query. The frame carries
+        a flat int64 debitingTime_ms column so date-window filtering is a
+        single vectorized comparison.
+        """
+        if self._ops_df_dirty:
+            # Clear the flag before snapshotting: a rebuild racing past
+            # here re-sets it, so the next query rebuilds again instead of
+            # trusting a stale frame.
+            self._ops_df_dirty = False
+            keys, ops = self._ops_index
+            df = pd.DataFrame.from_records(ops, columns=self._TBANK_COLUMNS)
+            # Every indexed operation has debitingTime.milliseconds, so the
+            # flat column materializes straight to unboxed int64.
+            df["debitingTime_ms"] = pd.Series(keys, dtype="int64")
+            self._ops_df = df
+        return self._ops_df
+
     def __load_cached_operations(self):
         """
-        Loads the cached operations from the JSON file.
+        Loads the cached operations from the snapshot file, preferring the
+        gzip-compressed variant when it exists.
         Returns a dict keyed by each operation's unique id.
-        If the file does not exist or is empty, returns an empty dict.
+        If no snapshot exists or it is empty, returns an empty dict.
         """
-        if not os.path.exists(self.operations_file):
-            return {}
+        gz_file = self.operations_file + ".gz"
+        snapshot = gz_file if os.path.exists(gz_file) else self.operations_file
+        # If the snapshot on disk hasn't changed since we last read or
+        # wrote it (including "still absent"), the in-memory dict is
+        # already current — it can only be fresher, since new batches land
+        # in memory first — so skip the read and the full JSON re-parse.
+        try:
+            mtime_ns = os.stat(snapshot).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self._cache_mtime_ns:
+            return self.all_operations
         try:
-            with open(self.operations_file, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-                if content:
-                    operations = json.loads(content)
-                else:
-                    operations = {}
+            if os.path.exists(gz_file):
+                with gzip.open(gz_file, "rb") as f:
+                    content = f.read().strip()
+            elif os.path.exists(self.operations_file):
+                with open(self.operations_file, "rb") as f:
+                    content = f.read().strip()
+            else:
+                content = b""
+            operations = orjson.loads(content) if content else {}
         except Exception as e:
             self.logger.error(f"Error loading cached operations: {e}")
             operations = {}
+        # Replay the append-only oplog over the snapshot: it holds whatever
+        # arrived since the last full rewrite.
+        if os.path.exists(self.operations_log_file):
+            try:
+                with open(self.operations_log_file, "rb") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        op = orjson.loads(line)
+                        if op.get("id"):
+                            operations[op["id"]] = op
+            except Exception as e:
+                self.logger.error(f"Error replaying operations log: {e}")
+        self._cache_mtime_ns = mtime_ns
         return operations
 
     def __save_new_operations_to_cache_file(self, get_operations_body: bytes):
         """
-        Extracts operations from the raw response bytes,
-        merges them with any existing operations in the cache,
-        and saves the unique set back to the file.
+        Extracts operations from the raw response bytes and merges them into
+        the in-memory cache, which is authoritative. New operations are
+        appended to a JSONL oplog; the full snapshot file is only rewritten
+        every SNAPSHOT_EVERY_BATCHES batches, so per-batch I/O is
+        O(new ops) instead of O(total cache).
         """
-        # Load existing operations (if any)
-        existing_operations = self.__load_cached_operations()
-        # self.logger.debug(f"existing_operations: {existing_operations}")
         try:
-            # If the data is gzip-compressed (first two bytes are 0x1f, 0x8b), decompress it.
-            # self.logger.debug(f"get_operations_body: {get_operations_body}")
-            if get_operations_body.startswith(b'\x1f\x8b'):
-                get_operations_body = gzip.decompress(get_operations_body)
-                # self.logger.debug(f"Decompressed gzip get_operations_body: {get_operations_body}")
-            # Decode and load the JSON response from the API
-            # self.logger.debug(f"UTF-8 decoded: {get_operations_body.decode("utf-8")}")
-            new_data = json.loads(get_operations_body.decode("utf-8"))
+            # The browser already inflated CDP-fetched bodies, so they
+            # normally arrive plain; the gzip branch stays as a safety net
+            # for compressed payloads. orjson parses the bytes directly —
+            # no str copy.
+            raw = gzip.decompress(get_operations_body) \
+                if get_operations_body[:2] == b'\x1f\x8b' else get_operations_body
+            new_data = orjson.loads(raw)
             # Expect operations to be in the "payload" key (a list)
-            # self.logger.debug(f"Deserialized object: {new_data}")
-            new_operations = new_data.get("payload", [])
-            # Merge each new operation into the existing dictionary using its unique id
-            for op in new_operations:
-                op_id = op.get("id")
-                if op_id:
-                    existing_operations[op_id] = op
-            # Save the merged operations dictionary back to file (overwrite existing file)
-            with open(self.operations_file, "w", encoding="utf-8") as f:
-                self.all_operations = existing_operations
-                json.dump(existing_operations, f, ensure_ascii=False, indent=4)
+            fresh_operations = {op["id"]: op for op in new_data.get("payload", []) if op.get("id")}
+            if not fresh_operations:
+                return
+            self.all_operations.update(fresh_operations)
+            self._rebuild_ops_index()
+            with open(self.operations_log_file, "ab") as f:
+                for op in fresh_operations.values():
+                    f.write(orjson.dumps(op) + b"\n")
+            self._batches_since_snapshot += 1
+            if self._batches_since_snapshot >= self.SNAPSHOT_EVERY_BATCHES:
+                self.__snapshot_operations()
         except Exception as e:
             self.logger.error(f"Error processing new operations: {e}")
 
+    def __snapshot_operations(self):
+        """
+        Rewrites the full snapshot file from the in-memory cache and
+        truncates the oplog it subsumes. The snapshot is gzip-compressed at
+        the lowest level: the operations JSON is repetitive enough that
+        level 1 already shrinks it several-fold while keeping the write fast.
+        """
+        with gzip.open(self.operations_file + ".gz", "wb", compresslevel=1) as f:
+            # Compact output: the snapshot is machine-read only, and
+            # skipping indentation cuts both serialize time and file size.
+            f.write(orjson.dumps(self.all_operations))
+        open(self.operations_log_file, "wb").close()
+        self._batches_since_snapshot = 0
+        self._cache_mtime_ns = os.stat(self.operations_file + ".gz").st_mtime_ns
+
+    def _wait_for_network_request(self, matcher, timeout: float):
+        """
+        Polls the performance log until a completed response's URL
+        satisfies matcher (a substring or a compiled pattern). Returns
+        (url, request_headers, request_id) or raises TimeoutException.
+        CDP replacement for selenium-wire's wait_for_request; only used
+        before _event_loop starts, which then owns the log.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for url, request_headers, request_id in self._drain_network_responses():
+                matched = matcher.match(url) if hasattr(matcher, "match") else matcher in url
+                if matched:
+                    return url, request_headers, request_id
+            time.sleep(0.5)
+        raise TimeoutException(f"No request matching '{matcher}' was seen within {timeout} seconds")
+
     def _login_and_save_session(self):
         try:
             self.logger.info("No valid session found. Initiating login process...")
             self.driver.get(self.LOGIN_URL)
             self.logger.info(f"Waiting {self.login_timeout_seconds} seconds for the user to log in manually...")
-            self.driver.wait_for_request(self.MAIN_URL, self.login_timeout_seconds)
+            self._wait_for_network_request(self.MAIN_URL, self.login_timeout_seconds)
 
             self.logger.info(f"Opening operations page...")
             self.driver.get(self.OPERATIONS_PAGE_URL)
-            request = self.driver.wait_for_request(self.OPERATIONS_ENDPOINT_REGEX,
-                                                   timeout=self.operations_page_timeout_seconds)
-            self.headers = request.headers
-            self.__initialize_tbank_public_api_endpoints(request.params)
+            url, request_headers, request_id = self._wait_for_network_request(
+                self._OPERATIONS_RE, timeout=self.operations_page_timeout_seconds)
+            self.headers = request_headers
+            self.__initialize_tbank_public_api_endpoints()
 
-            if request:
-                self.logger.info("get_operations request detected.")
-                self.__save_new_operations_to_cache_file(request.response.body)
+            self.logger.info("get_operations request detected.")
+            body = self._fetch_response_body(request_id)
+            if body:
+                self.__save_new_operations_to_cache_file(body)
 
         except TimeoutException:
             self.logger.error(f"User didn't logged in in {self.login_timeout_seconds} seconds...")
@@ -304,6 +528,9 @@ class TBankApiClient:
         self.headers = {
             "User-Agent": self.driver.execute_script("return navigator.userAgent;")
         }
+        # Freeze the headers into the session once instead of rewriting
+        # them per outbound request.
+        self.session.headers.update(self.headers)
 
         session_data = {
             "cookies": self.request_cookies,
@@ -312,7 +539,9 @@ class TBankApiClient:
             "local_storage": self.get_local_storage()
         }
         with open(self.path_to_cookies_file, "wb") as f:
-            pickle.dump(session_data, f)
+            # Highest protocol emits a compact binary stream; the default
+            # costs more CPU and bytes for these cookie-heavy dicts.
+            pickle.dump(session_data, f, protocol=pickle.HIGHEST_PROTOCOL)
         self.logger.info("Session conserved to file.")
 
     def get_local_storage(self):
@@ -325,25 +554,42 @@ class TBankApiClient:
             return ls;
         """)
 
+    def reload_cache(self):
+        """
+        Re-syncs the in-memory cache with the on-disk snapshot. The mtime
+        short-circuit in __load_cached_operations makes this a single
+        os.stat when nothing else wrote the snapshot, so get_operations
+        can afford to call it per query.
+        """
+        loaded = self.__load_cached_operations()
+        if loaded is self.all_operations:
+            return
+        # Another writer updated the snapshot. Batches captured by this
+        # process land in memory before disk, so in-memory entries win.
+        loaded.update(self.all_operations)
+        self.all_operations = loaded
+        self._rebuild_ops_index()
+
     def get_operations(self, _filter: TBankOperationsFilter):
         """
         Loads all cached operations, filters them according to the provided TBankOperationsFilter,
         and returns the result in the desired format (either as a list of dicts or a pandas DataFrame).
         Filtering is done based on the 'debitingTime' field (milliseconds).
         """
-        # Load all cached operations (a dict keyed by operation id)
-        cached_ops = self.all_operations
+        self.reload_cache()
         # Convert the filter's date_from and date_to to integers (assumed to be in milliseconds)
         date_from = int(_filter.date_from)
         date_to = int(_filter.date_to)
-        # Filter operations based on their debitingTime milliseconds value
-        filtered_ops = [
-            op for op in cached_ops.values()
-            if op.get("debitingTime", {}).get("milliseconds") is not None and
-            date_from <= int(op["debitingTime"]["milliseconds"]) <= date_to
-        ]
-        # Return result as DataFrame or list, depending on _filter.result_format
         if _filter.result_format == pd.DataFrame:
-            return pd.DataFrame(filtered_ops)
-        else:
-            return filtered_ops
+            # The cached frame is already sorted by debitingTime_ms, so the
+            # window is one vectorized comparison over an int64 column.
+            df = self._get_ops_df()
+            ms = df["debitingTime_ms"]
+            return df[(ms >= date_from) & (ms <= date_to)]
+        # The index is sorted by debiting time, so the date window is a
+        # binary search in C plus one contiguous slice — no per-operation
+        # branching.
+        keys, ops = self._ops_index
+        lo = int(np.searchsorted(keys, date_from, side="left"))
+        hi = int(np.searchsorted(keys, date_to, side="right"))
+        return ops[lo:hi]
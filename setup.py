@@ -9,7 +9,13 @@ setup(
     install_requires=[
         "requests",
         "selenium",
-        "pandas"
+        "pandas",
+        "numpy",
+        "msgspec",
+        "orjson",
+        "ijson",
+        "aiohttp",
+        "httpx[http2]"
     ],
     classifiers=[
         "Programming Language :: Python :: 3",